@@ -6,20 +6,34 @@ health checking, and pool statistics.
 """
 
 import asyncio
-from typing import Optional
+from contextlib import asynccontextmanager
+from typing import Optional, TypedDict
 
 from fastapi import FastAPI, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
+from models import Proxy, ProxyProtocol, ProxyStatus
 from proxy_manager import ProxyManager
 from health_checker import HealthChecker
 from rotator import ProxyRotator
 from config import config
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Release shared resources when the application shuts down."""
+    yield
+    await checker.aclose()
+    manager.close()
+
+
 app = FastAPI(
     title="Proxy Manager API",
     description="RESTful API for managing proxy pools",
     version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 manager = ProxyManager()
@@ -37,8 +51,8 @@ class ProxyCreate(BaseModel):
     country: Optional[str] = None
 
 
-class ProxyResponse(BaseModel):
-    """Schema for proxy response data."""
+class ProxyResponse(TypedDict):
+    """Shape of proxy response data."""
     address: str
     port: int
     protocol: str
@@ -47,31 +61,34 @@ class ProxyResponse(BaseModel):
     success_rate: float
 
 
+def _proxy_to_dict(p: Proxy) -> ProxyResponse:
+    """Serialize a proxy for API responses without model re-validation."""
+    return {
+        "address": p.address,
+        "port": p.port,
+        "protocol": p.protocol.value,
+        "status": p.status.value,
+        "latency_ms": p.latency_ms,
+        "success_rate": p.success_rate,
+    }
+
+
 @app.get("/api/proxies")
 async def list_proxies(
     status: Optional[str] = Query(None, description="Filter by status"),
     protocol: Optional[str] = Query(None, description="Filter by protocol"),
 ):
     """List all proxies with optional filtering."""
-    proxies = manager.get_all_proxies()
-
-    if status:
-        proxies = [p for p in proxies if p.status.value == status]
-    if protocol:
-        proxies = [p for p in proxies if p.protocol.value == protocol]
+    # Convert filters to enum members once so matching is an identity check
+    try:
+        status_enum = ProxyStatus(status) if status else None
+        protocol_enum = ProxyProtocol(protocol) if protocol else None
+    except ValueError:
+        return {"proxies": [], "total": 0}
 
+    proxies = manager.filter_proxies(status=status_enum, protocol=protocol_enum)
     return {
-        "proxies": [
-            ProxyResponse(
-                address=p.address,
-                port=p.port,
-                protocol=p.protocol.value,
-                status=p.status.value,
-                latency_ms=p.latency_ms,
-                success_rate=p.success_rate,
-            )
-            for p in proxies
-        ],
+        "proxies": [_proxy_to_dict(p) for p in proxies],
         "total": len(proxies),
     }
 
@@ -106,17 +123,10 @@ async def get_next_proxy(
     strategy: str = Query("round_robin", description="Rotation strategy"),
 ):
     """Get the next available proxy using specified rotation strategy."""
-    proxy = rotator.get_next(manager.get_all_proxies(), strategy)
+    proxy = rotator.select(manager.get_active_proxies(), strategy)
     if not proxy:
         raise HTTPException(status_code=503, detail="No active proxies available")
-    return ProxyResponse(
-        address=proxy.address,
-        port=proxy.port,
-        protocol=proxy.protocol.value,
-        status=proxy.status.value,
-        latency_ms=proxy.latency_ms,
-        success_rate=proxy.success_rate,
-    )
+    return _proxy_to_dict(proxy)
 
 
 @app.post("/api/health-check")
@@ -139,13 +149,14 @@ async def get_stats():
     return {
         "pool_size": manager.pool_size,
         "active_count": manager.active_count,
-        "protocols": {
-            proto: len([p for p in manager.get_all_proxies() if p.protocol.value == proto])
-            for proto in ["http", "https", "socks5"]
-        },
+        "protocols": manager.get_protocol_counts(),
     }
 
 
 if __name__ == "__main__":
     import uvicorn
+
+    # uvicorn's loop="auto"/http="auto" defaults already pick uvloop and
+    # httptools when installed (uvicorn[standard]), falling back to
+    # asyncio/h11 otherwise
     uvicorn.run(app, host=config.api_host, port=config.api_port)
\ No newline at end of file
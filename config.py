@@ -21,6 +21,7 @@ class ProxyConfig:
     health_check_timeout: int = int(os.getenv("HEALTH_CHECK_TIMEOUT", "10"))
     health_check_interval: int = int(os.getenv("HEALTH_CHECK_INTERVAL", "300"))
     max_consecutive_failures: int = int(os.getenv("MAX_FAILURES", "3"))
+    health_check_concurrency: int = int(os.getenv("HEALTH_CHECK_CONCURRENCY", "20"))
 
     # Rotation Settings
     default_strategy: str = os.getenv("ROTATION_STRATEGY", "round_robin")
@@ -6,9 +6,12 @@ async HTTP requests with configurable timeout and targets.
 """
 
 import asyncio
+import os
 import time
 import logging
-from typing import List
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
 
 import aiohttp
 
@@ -17,13 +20,32 @@ from config import config
 
 logger = logging.getLogger(__name__)
 
+# Proxy fields updated by a health check, copied back from worker processes.
+_CHECK_FIELDS = (
+    "latency_ms",
+    "success_count",
+    "failure_count",
+    "consecutive_failures",
+    "last_check_time",
+    "success_rate",
+    "status",
+)
+
 
 class HealthChecker:
     """
     Asynchronous proxy health checker.
     
     Verifies proxy connectivity by making HTTP requests through
-    each proxy to a configurable health check URL.
+    each proxy to a configurable health check URL. A single pooled
+    ClientSession is created lazily and reused across checks; call
+    aclose() when the checker is no longer needed.
+
+    Concurrency is enforced by the session's TCPConnector limit:
+    requests beyond `concurrency` wait in the connector queue. A proxy
+    is only marked CHECKING once its request holds a connection, and
+    neither the per-check deadline nor the measured latency includes
+    time spent waiting in the queue.
     """
 
     def __init__(
@@ -31,10 +53,73 @@ class HealthChecker:
         check_url: str = None,
         timeout: int = None,
         max_failures: int = None,
+        concurrency: int = None,
     ):
         self.check_url = check_url or config.health_check_url
         self.timeout = timeout or config.health_check_timeout
         self.max_failures = max_failures or config.max_consecutive_failures
+        self.concurrency = concurrency or config.health_check_concurrency
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_lock = asyncio.Lock()
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared ClientSession, creating it on first use."""
+        if self._session is not None and not self._session.closed:
+            return self._session
+
+        async with self._session_lock:
+            if self._session is None or self._session.closed:
+                trace_config = aiohttp.TraceConfig()
+                trace_config.on_connection_queued_start.append(
+                    self._on_connection_queued
+                )
+                trace_config.on_connection_queued_end.append(
+                    self._on_connection_dequeued
+                )
+                trace_config.on_connection_create_end.append(
+                    self._on_connection_acquired
+                )
+                trace_config.on_connection_reuseconn.append(
+                    self._on_connection_acquired
+                )
+                connector = aiohttp.TCPConnector(
+                    limit=self.concurrency,
+                    limit_per_host=0,
+                    ssl=False,
+                    ttl_dns_cache=300,
+                    enable_cleanup_closed=True,
+                )
+                self._session = aiohttp.ClientSession(
+                    connector=connector,
+                    timeout=aiohttp.ClientTimeout(
+                        total=None,
+                        sock_connect=self.timeout,
+                        sock_read=self.timeout,
+                    ),
+                    trace_configs=[trace_config],
+                )
+        return self._session
+
+    async def _on_connection_queued(self, session, trace_ctx, params) -> None:
+        """Pause the per-check deadline while waiting for a connection slot."""
+        trace_ctx.trace_request_ctx["deadline"].reschedule(None)
+
+    async def _on_connection_dequeued(self, session, trace_ctx, params) -> None:
+        """Restart the latency clock and deadline once a slot is free."""
+        ctx = trace_ctx.trace_request_ctx
+        ctx["start"] = time.time()
+        ctx["deadline"].reschedule(asyncio.get_running_loop().time() + self.timeout)
+
+    @staticmethod
+    async def _on_connection_acquired(session, trace_ctx, params) -> None:
+        """Mark the proxy CHECKING once its request holds a connection."""
+        trace_ctx.trace_request_ctx["proxy"].status = ProxyStatus.CHECKING
+
+    async def aclose(self) -> None:
+        """Close the shared ClientSession and its connection pool."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
 
     async def check_single(self, proxy: Proxy) -> bool:
         """
@@ -46,38 +131,41 @@ class HealthChecker:
         Returns:
             True if proxy is healthy, False otherwise.
         """
-        proxy.status = ProxyStatus.CHECKING
-        start_time = time.time()
+        session = await self._get_session()
+        ctx = {"proxy": proxy, "start": time.time()}
 
         try:
-            connector = aiohttp.TCPConnector(ssl=False)
-            timeout_config = aiohttp.ClientTimeout(total=self.timeout)
-
-            async with aiohttp.ClientSession(
-                connector=connector, timeout=timeout_config
-            ) as session:
+            # Overall deadline; paused by the trace hooks while queued
+            async with asyncio.timeout(self.timeout) as deadline:
+                ctx["deadline"] = deadline
                 async with session.get(
-                    self.check_url,
-                    proxy=proxy.url,
+                    self.check_url, proxy=proxy.url, trace_request_ctx=ctx
                 ) as response:
                     if response.status == 200:
-                        latency = (time.time() - start_time) * 1000
+                        latency = (time.time() - ctx["start"]) * 1000
                         proxy.record_success(latency)
-                        logger.debug(
-                            "Proxy %s:%d healthy (%.0fms)",
-                            proxy.address,
-                            proxy.port,
-                            latency,
-                        )
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(
+                                "Proxy %s:%d healthy (%.0fms)",
+                                proxy.address,
+                                proxy.port,
+                                latency,
+                            )
                         return True
 
         except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as e:
-            logger.debug(
-                "Proxy %s:%d failed: %s", proxy.address, proxy.port, str(e)
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Proxy %s:%d failed: %s", proxy.address, proxy.port, e
+                )
 
         proxy.record_failure()
 
+        # A check that failed before getting a connection never went
+        # through CHECKING; take the proxy out of rotation all the same
+        if proxy.status is ProxyStatus.ACTIVE:
+            proxy.status = ProxyStatus.CHECKING
+
         # Ban proxy if too many consecutive failures
         if proxy.consecutive_failures >= self.max_failures:
             proxy.status = ProxyStatus.BANNED
@@ -90,39 +178,38 @@ class HealthChecker:
 
         return False
 
-    async def check_batch(
-        self, proxies: List[Proxy], concurrency: int = 20
-    ) -> HealthCheckResult:
+    async def check_batch(self, proxies: List[Proxy]) -> HealthCheckResult:
         """
         Check multiple proxies concurrently.
 
+        The number of checks in flight is capped by the shared
+        connector's limit (see `concurrency` in __init__).
+
         Args:
             proxies: List of proxies to check.
-            concurrency: Max concurrent checks.
 
         Returns:
             HealthCheckResult with aggregated statistics.
         """
         start_time = time.time()
-        semaphore = asyncio.Semaphore(concurrency)
-
-        async def bounded_check(proxy: Proxy) -> bool:
-            async with semaphore:
-                return await self.check_single(proxy)
-
         results = await asyncio.gather(
-            *[bounded_check(p) for p in proxies],
+            *(self.check_single(p) for p in proxies),
             return_exceptions=True,
         )
 
-        healthy = sum(1 for r in results if r is True)
+        # Tally results and active-proxy latency in a single pass;
+        # exceptions returned by gather count as unhealthy.
+        healthy = 0
+        active = 0
+        latency_sum = 0.0
+        for proxy, ok in zip(proxies, results):
+            if ok is True:
+                healthy += 1
+            if proxy.status is ProxyStatus.ACTIVE:
+                active += 1
+                latency_sum += proxy.latency_ms
         unhealthy = len(proxies) - healthy
-        active_proxies = [p for p in proxies if p.status == ProxyStatus.ACTIVE]
-        avg_latency = (
-            sum(p.latency_ms for p in active_proxies) / len(active_proxies)
-            if active_proxies
-            else 0
-        )
+        avg_latency = latency_sum / active if active else 0.0
 
         result = HealthCheckResult(
             total=len(proxies),
@@ -138,4 +225,101 @@ class HealthChecker:
             len(proxies),
             result.check_duration_s,
         )
-        return result
\ No newline at end of file
+        return result
+
+    async def check_batch_parallel(
+        self, proxies: List[Proxy], workers: int = None
+    ) -> HealthCheckResult:
+        """
+        Check a large pool by sharding it across worker processes.
+
+        Each worker runs check_batch on its shard with its own event
+        loop and session; check results are then copied back onto the
+        given Proxy objects. Useful only when the pool is far larger
+        than `concurrency` and a single event loop becomes CPU-bound.
+
+        Args:
+            proxies: List of proxies to check.
+            workers: Number of worker processes (default: CPU count).
+
+        Returns:
+            HealthCheckResult aggregated over all shards.
+        """
+        workers = min(workers or os.cpu_count() or 1, len(proxies))
+        if workers <= 1:
+            return await self.check_batch(proxies)
+
+        start_time = time.time()
+        shard_size = -(-len(proxies) // workers)
+        shards = [
+            proxies[i:i + shard_size] for i in range(0, len(proxies), shard_size)
+        ]
+        settings = {
+            "check_url": self.check_url,
+            "timeout": self.timeout,
+            "max_failures": self.max_failures,
+            "concurrency": self.concurrency,
+        }
+
+        loop = asyncio.get_running_loop()
+        # Workers are spawned: this process runs an event loop, resolver
+        # threads and a queue-backed root log handler, none of which fork safely
+        pool = ProcessPoolExecutor(
+            max_workers=len(shards),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        try:
+            shard_results = await asyncio.gather(
+                *(
+                    loop.run_in_executor(pool, self._run_shard, shard, settings)
+                    for shard in shards
+                )
+            )
+        finally:
+            # Never join the workers on the event-loop thread: on cancellation
+            # that would block the loop until every running shard finishes
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        healthy = 0
+        active = 0
+        latency_sum = 0.0
+        for shard, (shard_result, checked) in zip(shards, shard_results):
+            healthy += shard_result.healthy
+            for proxy, updated in zip(shard, checked):
+                for name in _CHECK_FIELDS:
+                    setattr(proxy, name, getattr(updated, name))
+                if proxy.status is ProxyStatus.ACTIVE:
+                    active += 1
+                    latency_sum += proxy.latency_ms
+
+        result = HealthCheckResult(
+            total=len(proxies),
+            healthy=healthy,
+            unhealthy=len(proxies) - healthy,
+            avg_latency_ms=round(latency_sum / active if active else 0.0, 2),
+            check_duration_s=round(time.time() - start_time, 2),
+        )
+
+        logger.info(
+            "Parallel health check complete: %d/%d healthy across %d workers (%.2fs)",
+            healthy,
+            len(proxies),
+            len(shards),
+            result.check_duration_s,
+        )
+        return result
+
+    @staticmethod
+    def _run_shard(
+        proxies: List[Proxy], settings: dict
+    ) -> Tuple[HealthCheckResult, List[Proxy]]:
+        """Run check_batch on one shard inside a worker process."""
+        checker = HealthChecker(**settings)
+
+        async def run() -> HealthCheckResult:
+            try:
+                return await checker.check_batch(proxies)
+            finally:
+                await checker.aclose()
+
+        return asyncio.run(run()), proxies
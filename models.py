@@ -12,21 +12,49 @@ from typing import Optional
 
 
 class ProxyProtocol(str, Enum):
-    """Supported proxy protocols."""
+    """Supported proxy protocols. Members are singletons; compare with `is`."""
     HTTP = "http"
     HTTPS = "https"
     SOCKS5 = "socks5"
 
 
 class ProxyStatus(str, Enum):
-    """Proxy health status."""
+    """Proxy health status. Members are singletons; compare with `is`."""
     ACTIVE = "active"
     INACTIVE = "inactive"
     CHECKING = "checking"
     BANNED = "banned"
 
 
-@dataclass
+# Bumped on every Proxy.status assignment (see status_version)
+_status_version = 0
+
+
+def status_version() -> int:
+    """
+    Return a counter that changes whenever any proxy's status is assigned.
+
+    Callers caching status-derived views compare it against the value
+    seen at build time instead of registering per-proxy callbacks.
+    """
+    return _status_version
+
+
+def _count_status_writes(cls):
+    """Route writes to cls.status through the version counter; reads stay on the slot."""
+    slot = cls.status
+
+    def set_status(self, value) -> None:
+        global _status_version
+        slot.__set__(self, value)
+        _status_version += 1
+
+    cls.status = property(slot.__get__, set_status)
+    return cls
+
+
+@_count_status_writes
+@dataclass(slots=True)
 class Proxy:
     """Represents a single proxy server."""
 
@@ -44,18 +72,23 @@ class Proxy:
     last_check_time: float = 0.0
     created_at: float = field(default_factory=time.time)
 
-    @property
-    def url(self) -> str:
-        """Get the full proxy URL with authentication if available."""
+    # Derived values, computed once instead of on every access.
+    # Connection details never change after construction, so the URL
+    # is built in __post_init__; success_rate is refreshed by record_*.
+    url: str = field(init=False, repr=False, compare=False)
+    success_rate: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
         if self.username and self.password:
-            return f"{self.protocol.value}://{self.username}:{self.password}@{self.address}:{self.port}"
-        return f"{self.protocol.value}://{self.address}:{self.port}"
+            self.url = f"{self.protocol.value}://{self.username}:{self.password}@{self.address}:{self.port}"
+        else:
+            self.url = f"{self.protocol.value}://{self.address}:{self.port}"
+        self._update_rate()
 
-    @property
-    def success_rate(self) -> float:
-        """Calculate the success rate as a percentage."""
+    def _update_rate(self) -> None:
+        """Recalculate the success rate as a percentage."""
         total = self.success_count + self.failure_count
-        return (self.success_count / total * 100) if total > 0 else 0.0
+        self.success_rate = (self.success_count / total * 100) if total > 0 else 0.0
 
     def record_success(self, latency: float) -> None:
         """Record a successful health check."""
@@ -64,15 +97,17 @@ class Proxy:
         self.latency_ms = latency
         self.status = ProxyStatus.ACTIVE
         self.last_check_time = time.time()
+        self._update_rate()
 
     def record_failure(self) -> None:
         """Record a failed health check."""
         self.failure_count += 1
         self.consecutive_failures += 1
         self.last_check_time = time.time()
+        self._update_rate()
 
 
-@dataclass
+@dataclass(slots=True)
 class HealthCheckResult:
     """Result of a batch health check operation."""
     total: int = 0
@@ -7,13 +7,17 @@ and managing proxy pools with SQLite persistence.
 
 import sqlite3
 import logging
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
-from models import Proxy, ProxyProtocol, ProxyStatus
+from models import Proxy, ProxyProtocol, ProxyStatus, status_version
 from config import config
 
 logger = logging.getLogger(__name__)
 
+# Value -> member tables, avoiding an Enum call per row or per add.
+_PROTOCOLS = {p.value: p for p in ProxyProtocol}
+_STATUSES = {s.value: s for s in ProxyStatus}
+
 
 class ProxyManager:
     """
@@ -21,18 +25,34 @@ class ProxyManager:
     
     Manages a pool of proxy servers, providing CRUD operations,
     filtering, and integration with health checking and rotation.
+    A single SQLite connection is held for the manager's lifetime;
+    call close() to release it.
+
+    The list of active proxies is cached and rebuilt only after a
+    proxy's status changes or the pool is modified, and per-protocol
+    counts are maintained on add/remove.
     """
 
     def __init__(self, db_path: Optional[str] = None):
         self.db_path = db_path or config.db_path
-        self._pool: List[Proxy] = []
+        self._pool: Dict[Tuple[str, int], Proxy] = {}
+        self._active: List[Proxy] = []
+        self._active_dirty = True
+        self._active_version = status_version()
+        self._by_protocol: Dict[str, int] = {p.value: 0 for p in ProxyProtocol}
         self._init_database()
         self._load_proxies()
 
     def _init_database(self) -> None:
-        """Initialize SQLite database and create tables if needed."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
+        """Open the SQLite connection and create tables if needed."""
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+
+        with self._conn:
+            self._conn.execute("""
                 CREATE TABLE IF NOT EXISTS proxies (
                     address TEXT NOT NULL,
                     port INTEGER NOT NULL,
@@ -50,32 +70,31 @@ class ProxyManager:
                     PRIMARY KEY (address, port)
                 )
             """)
-            conn.commit()
         logger.info("Database initialized at %s", self.db_path)
 
     def _load_proxies(self) -> None:
         """Load all proxies from database into memory pool."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            rows = conn.execute("SELECT * FROM proxies").fetchall()
-            self._pool = [
-                Proxy(
-                    address=row["address"],
-                    port=row["port"],
-                    protocol=ProxyProtocol(row["protocol"]),
-                    status=ProxyStatus(row["status"]),
-                    username=row["username"],
-                    password=row["password"],
-                    country=row["country"],
-                    latency_ms=row["latency_ms"],
-                    success_count=row["success_count"],
-                    failure_count=row["failure_count"],
-                    consecutive_failures=row["consecutive_failures"],
-                    last_check_time=row["last_check_time"],
-                    created_at=row["created_at"],
-                )
-                for row in rows
-            ]
+        rows = self._conn.execute("SELECT * FROM proxies").fetchall()
+        self._pool = {
+            (row["address"], row["port"]): Proxy(
+                address=row["address"],
+                port=row["port"],
+                protocol=_PROTOCOLS[row["protocol"]],
+                status=_STATUSES[row["status"]],
+                username=row["username"],
+                password=row["password"],
+                country=row["country"],
+                latency_ms=row["latency_ms"],
+                success_count=row["success_count"],
+                failure_count=row["failure_count"],
+                consecutive_failures=row["consecutive_failures"],
+                last_check_time=row["last_check_time"],
+                created_at=row["created_at"],
+            )
+            for row in rows
+        }
+        for proxy in self._pool.values():
+            self._track(proxy)
         logger.info("Loaded %d proxies from database", len(self._pool))
 
     def add_proxy(
@@ -107,55 +126,159 @@ class ProxyManager:
         if protocol not in config.supported_protocols:
             raise ValueError(f"Unsupported protocol: {protocol}")
 
-        # Check for duplicates
-        for p in self._pool:
-            if p.address == address and p.port == port:
-                raise ValueError(f"Proxy {address}:{port} already exists")
+        if (address, port) in self._pool:
+            raise ValueError(f"Proxy {address}:{port} already exists")
 
         proxy = Proxy(
             address=address,
             port=port,
-            protocol=ProxyProtocol(protocol),
+            protocol=_PROTOCOLS[protocol],
             username=username,
             password=password,
             country=country,
         )
 
         # Persist to database
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
+        with self._conn:
+            self._conn.execute(
                 """INSERT INTO proxies (address, port, protocol, username, password, country, created_at)
                    VALUES (?, ?, ?, ?, ?, ?, ?)""",
                 (address, port, protocol, username, password, country, proxy.created_at),
             )
-            conn.commit()
 
-        self._pool.append(proxy)
+        self._pool[(address, port)] = proxy
+        self._track(proxy)
         logger.info("Added proxy %s:%d (%s)", address, port, protocol)
         return proxy
 
+    def bulk_add(self, rows: Iterable[dict]) -> List[Proxy]:
+        """
+        Add many proxies in a single database transaction.
+
+        Args:
+            rows: Dicts with the same keys as add_proxy's arguments
+                (address, port, and optionally protocol, username,
+                password, country).
+
+        Returns:
+            The created Proxy objects, in input order.
+
+        Raises:
+            ValueError: If any proxy already exists, appears twice in
+                rows, or has an invalid protocol. Nothing is added.
+        """
+        proxies: Dict[Tuple[str, int], Proxy] = {}
+        for row in rows:
+            address, port = row["address"], row["port"]
+            protocol = row.get("protocol", "http")
+            if protocol not in config.supported_protocols:
+                raise ValueError(f"Unsupported protocol: {protocol}")
+            if (address, port) in self._pool or (address, port) in proxies:
+                raise ValueError(f"Proxy {address}:{port} already exists")
+            proxies[(address, port)] = Proxy(
+                address=address,
+                port=port,
+                protocol=_PROTOCOLS[protocol],
+                username=row.get("username"),
+                password=row.get("password"),
+                country=row.get("country"),
+            )
+
+        with self._conn:
+            self._conn.executemany(
+                """INSERT INTO proxies (address, port, protocol, username, password, country, created_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                [
+                    (p.address, p.port, p.protocol.value, p.username, p.password, p.country, p.created_at)
+                    for p in proxies.values()
+                ],
+            )
+
+        self._pool.update(proxies)
+        for proxy in proxies.values():
+            self._track(proxy)
+        logger.info("Added %d proxies", len(proxies))
+        return list(proxies.values())
+
     def remove_proxy(self, address: str, port: int) -> bool:
         """Remove a proxy from the pool and database."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
+        with self._conn:
+            cursor = self._conn.execute(
                 "DELETE FROM proxies WHERE address = ? AND port = ?",
                 (address, port),
             )
-            conn.commit()
-            removed = cursor.rowcount > 0
+        removed = cursor.rowcount > 0
 
         if removed:
-            self._pool = [p for p in self._pool if not (p.address == address and p.port == port)]
+            proxy = self._pool.pop((address, port), None)
+            if proxy is not None:
+                self._untrack(proxy)
             logger.info("Removed proxy %s:%d", address, port)
         return removed
 
+    def _track(self, proxy: Proxy) -> None:
+        """Account for a proxy added to the pool."""
+        self._by_protocol[proxy.protocol.value] += 1
+        self._active_dirty = True
+
+    def _untrack(self, proxy: Proxy) -> None:
+        """Account for a proxy removed from the pool."""
+        self._by_protocol[proxy.protocol.value] -= 1
+        self._active_dirty = True
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+        logger.info("Database connection closed")
+
     def get_active_proxies(self) -> List[Proxy]:
-        """Get all proxies with active status."""
-        return [p for p in self._pool if p.status == ProxyStatus.ACTIVE]
+        """
+        Get all proxies with active status.
+
+        The returned list is a cached snapshot shared between callers
+        and must not be modified.
+        """
+        version = status_version()
+        if self._active_dirty or version != self._active_version:
+            self._active = [p for p in self._pool.values() if p.status is ProxyStatus.ACTIVE]
+            self._active_dirty = False
+            self._active_version = version
+        return self._active
 
     def get_all_proxies(self) -> List[Proxy]:
-        """Get all proxies regardless of status."""
-        return list(self._pool)
+        """Get all proxies regardless of status, in insertion order."""
+        return list(self._pool.values())
+
+    def filter_proxies(
+        self,
+        status: Optional[ProxyStatus] = None,
+        protocol: Optional[ProxyProtocol] = None,
+    ) -> List[Proxy]:
+        """
+        Get proxies matching a status and/or protocol in a single pass.
+
+        Args:
+            status: Optional status to match.
+            protocol: Optional protocol to match.
+
+        Returns:
+            Matching proxies in pool order.
+        """
+        if status is ProxyStatus.ACTIVE:
+            candidates = self.get_active_proxies()
+            status = None
+        else:
+            candidates = self._pool.values()
+
+        return [
+            p for p in candidates
+            if (status is None or p.status is status)
+            and (protocol is None or p.protocol is protocol)
+        ]
+
+    def get_protocol_counts(self) -> Dict[str, int]:
+        """Get the number of proxies per protocol."""
+        return dict(self._by_protocol)
 
     @property
     def pool_size(self) -> int:
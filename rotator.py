@@ -5,14 +5,19 @@ Implements multiple rotation strategies for selecting
 the next proxy from the active pool.
 """
 
+import itertools
 import random
 import logging
+from operator import attrgetter
 from typing import List, Optional
 
 from models import Proxy, ProxyStatus
 
 logger = logging.getLogger(__name__)
 
+_latency = attrgetter("latency_ms")
+_success_rate = attrgetter("success_rate")
+
 
 class ProxyRotator:
     """
@@ -26,7 +31,13 @@ class ProxyRotator:
     """
 
     def __init__(self):
-        self._index: int = 0
+        self._rr = itertools.count()
+        self._strategies = {
+            "round_robin": self._round_robin,
+            "random": self._random,
+            "latency": self._lowest_latency,
+            "weighted": self._weighted_random,
+        }
 
     def get_next(
         self, proxies: List[Proxy], strategy: str = "round_robin"
@@ -41,20 +52,31 @@ class ProxyRotator:
         Returns:
             Selected Proxy or None if no active proxies available.
         """
-        active = [p for p in proxies if p.status == ProxyStatus.ACTIVE]
+        active = [p for p in proxies if p.status is ProxyStatus.ACTIVE]
+        return self.select(active, strategy)
 
+    def select(
+        self, active: List[Proxy], strategy: str = "round_robin"
+    ) -> Optional[Proxy]:
+        """
+        Select a proxy from a list already known to be active.
+
+        Skips the status filter in get_next, so callers holding a cached
+        active list (see ProxyManager.get_active_proxies) pay no per-call
+        scan or allocation.
+
+        Args:
+            active: Proxies with active status.
+            strategy: Rotation strategy to use.
+
+        Returns:
+            Selected Proxy or None if the list is empty.
+        """
         if not active:
             logger.warning("No active proxies available for rotation")
             return None
 
-        strategy_map = {
-            "round_robin": self._round_robin,
-            "random": self._random,
-            "latency": self._lowest_latency,
-            "weighted": self._weighted_random,
-        }
-
-        strategy_fn = strategy_map.get(strategy, self._round_robin)
+        strategy_fn = self._strategies.get(strategy, self._round_robin)
         selected = strategy_fn(active)
 
         if selected:
@@ -68,20 +90,18 @@ class ProxyRotator:
 
     def _round_robin(self, proxies: List[Proxy]) -> Proxy:
         """Select proxies in sequential order."""
-        self._index = self._index % len(proxies)
-        proxy = proxies[self._index]
-        self._index += 1
-        return proxy
+        return proxies[next(self._rr) % len(proxies)]
 
     def _random(self, proxies: List[Proxy]) -> Proxy:
         """Select a random proxy from the pool."""
         return random.choice(proxies)
 
     def _lowest_latency(self, proxies: List[Proxy]) -> Proxy:
-        """Select the proxy with the lowest latency."""
-        return min(proxies, key=lambda p: p.latency_ms if p.latency_ms > 0 else float("inf"))
+        """Select the proxy with the lowest latency, ignoring unmeasured ones."""
+        measured = [p for p in proxies if p.latency_ms > 0]
+        return min(measured, key=_latency) if measured else proxies[0]
 
     def _weighted_random(self, proxies: List[Proxy]) -> Proxy:
         """Select proxy weighted by success rate."""
-        weights = [max(p.success_rate, 1.0) for p in proxies]
+        weights = [r if r > 1.0 else 1.0 for r in map(_success_rate, proxies)]
         return random.choices(proxies, weights=weights, k=1)[0]
\ No newline at end of file
@@ -4,7 +4,7 @@ import asyncio
 import logging
 import time
 from typing import List, Optional, Dict, Callable
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from enum import Enum
 
 logger = logging.getLogger(__name__)
@@ -18,7 +18,7 @@ class RotationStrategy(Enum):
     FAILOVER = "failover"
 
 
-@dataclass
+@dataclass(slots=True)
 class SchedulerConfig:
     strategy: RotationStrategy = RotationStrategy.ROUND_ROBIN
     health_check_interval: int = 60
@@ -27,7 +27,7 @@ class SchedulerConfig:
     auto_remove_dead: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ProxyStats:
     proxy_url: str
     total_requests: int = 0
@@ -53,11 +53,11 @@ class ProxyScheduler:
     def add_proxy(self, proxy_url: str, weight: int = 1) -> None:
         if proxy_url not in self._proxies:
             self._proxies[proxy_url] = ProxyStats(proxy_url=proxy_url)
-            logger.info(f"Added proxy: {proxy_url}")
+            logger.info("Added proxy: %s", proxy_url)
 
     def remove_proxy(self, proxy_url: str) -> None:
         self._proxies.pop(proxy_url, None)
-        logger.info(f"Removed proxy: {proxy_url}")
+        logger.info("Removed proxy: %s", proxy_url)
 
     async def get_next(self) -> Optional[str]:
         async with self._lock:
@@ -65,15 +65,26 @@ class ProxyScheduler:
             if not available:
                 logger.warning("No available proxies")
                 return None
+            return self._select(available)
 
-            if self.config.strategy == RotationStrategy.ROUND_ROBIN:
-                return self._round_robin(available)
-            elif self.config.strategy == RotationStrategy.LEAST_USED:
-                return self._least_used(available)
-            elif self.config.strategy == RotationStrategy.FAILOVER:
-                return self._failover(available)
-            else:
-                return self._round_robin(available)
+    async def get_next_batch(self, n: int) -> List[str]:
+        """Pick n proxies under a single lock acquisition and availability scan."""
+        async with self._lock:
+            available = self._get_available_proxies()
+            if not available:
+                logger.warning("No available proxies")
+                return []
+            return [self._select(available) for _ in range(n)]
+
+    def _select(self, available: List[ProxyStats]) -> str:
+        if self.config.strategy == RotationStrategy.ROUND_ROBIN:
+            return self._round_robin(available)
+        elif self.config.strategy == RotationStrategy.LEAST_USED:
+            return self._least_used(available)
+        elif self.config.strategy == RotationStrategy.FAILOVER:
+            return self._failover(available)
+        else:
+            return self._round_robin(available)
 
     def _get_available_proxies(self) -> List[ProxyStats]:
         now = time.time()
@@ -123,7 +134,17 @@ class ProxyScheduler:
             if stats.consecutive_failures >= self.config.max_failures:
                 stats.is_cooling_down = True
                 stats.cooldown_until = time.time() + self.config.cooldown_seconds
-                logger.warning(f"Proxy {proxy_url} cooling down for {self.config.cooldown_seconds}s")
+                logger.warning(
+                    "Proxy %s cooling down for %ds", proxy_url, self.config.cooldown_seconds
+                )
+
+    def reset(self) -> None:
+        """Zero all counters and cooldowns in place, keeping the proxy set."""
+        for stats in self._proxies.values():
+            for f in fields(stats):
+                if f.name != "proxy_url":
+                    setattr(stats, f.name, f.default)
+        self._rr_index = 0
 
     def get_stats(self) -> List[Dict]:
         return [
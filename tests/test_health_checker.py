@@ -0,0 +1,173 @@
+"""
+Health Checker Tests.
+
+Runs HealthChecker against a local stub HTTP proxy started with
+asyncio.start_server, so no external network access is needed.
+"""
+
+import asyncio
+import socket
+import time
+from contextlib import AsyncExitStack, asynccontextmanager
+
+import pytest
+
+from health_checker import HealthChecker
+from models import Proxy, ProxyStatus
+from proxy_manager import ProxyManager
+
+CHECK_URL = "http://check.invalid/ip"
+
+
+@asynccontextmanager
+async def stub_proxy(delay: float = 0.0, trickle: float = 0.0):
+    """
+    Serve a stub HTTP proxy on a free local port and yield the port.
+
+    Every request is answered with 200 after `delay` seconds. With
+    `trickle` set, the proxy instead sends one header byte every
+    `trickle` seconds and never finishes the response.
+    """
+    async def handle(reader, writer):
+        try:
+            await reader.readuntil(b"\r\n\r\n")
+            if trickle:
+                writer.write(b"HTTP/1.1 200 OK\r\nX-Slow: ")
+                for _ in range(100):
+                    await asyncio.sleep(trickle)
+                    writer.write(b"x")
+                    await writer.drain()
+            else:
+                await asyncio.sleep(delay)
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n"
+                    b"Connection: close\r\n\r\nok"
+                )
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    try:
+        yield server.sockets[0].getsockname()[1]
+    finally:
+        server.close()
+
+
+def make_proxies(port: int, count: int) -> list:
+    """Create active proxies that all point at the stub proxy."""
+    return [
+        Proxy(address="127.0.0.1", port=port, status=ProxyStatus.ACTIVE)
+        for _ in range(count)
+    ]
+
+
+def unused_port() -> int:
+    """Return a local port with nothing listening on it."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class TestHealthChecker:
+    """Tests for HealthChecker against a local stub proxy."""
+
+    @pytest.mark.asyncio
+    async def test_only_in_flight_proxies_are_checking(self):
+        """Test that proxies waiting for a connection keep their status."""
+        async with stub_proxy(delay=0.3) as port:
+            checker = HealthChecker(check_url=CHECK_URL, timeout=2, concurrency=2)
+            proxies = make_proxies(port, 10)
+            batch = asyncio.create_task(checker.check_batch(proxies))
+            await asyncio.sleep(0.1)
+            statuses = [p.status for p in proxies]
+            result = await batch
+            await checker.aclose()
+
+        assert statuses.count(ProxyStatus.CHECKING) <= 2
+        assert statuses.count(ProxyStatus.ACTIVE) >= 8
+        assert result.healthy == 10
+
+    @pytest.mark.asyncio
+    async def test_queue_wait_not_counted_against_timeout(self):
+        """Test that time spent queued counts toward neither timeout nor latency."""
+        async with stub_proxy(delay=0.3) as port:
+            checker = HealthChecker(check_url=CHECK_URL, timeout=1, concurrency=1)
+            proxies = make_proxies(port, 4)
+            result = await checker.check_batch(proxies)
+            await checker.aclose()
+
+        assert result.healthy == 4
+        assert all(p.latency_ms < 800 for p in proxies)
+
+    @pytest.mark.asyncio
+    async def test_trickling_proxy_hits_deadline(self):
+        """Test that a proxy trickling header bytes cannot outlast the timeout."""
+        async with stub_proxy(trickle=0.2) as port:
+            checker = HealthChecker(check_url=CHECK_URL, timeout=1, concurrency=2)
+            proxy = make_proxies(port, 1)[0]
+            start = time.monotonic()
+            healthy = await checker.check_single(proxy)
+            elapsed = time.monotonic() - start
+            await checker.aclose()
+
+        assert healthy is False
+        assert elapsed < 2
+        assert proxy.status is not ProxyStatus.ACTIVE
+
+    @pytest.mark.asyncio
+    async def test_check_batch_parallel_updates_pool(self):
+        """Test that sharded checks write results back to the managed proxies."""
+        manager = ProxyManager(db_path=":memory:")
+        async with AsyncExitStack() as stack:
+            healthy_ports = [
+                await stack.enter_async_context(stub_proxy()) for _ in range(3)
+            ]
+            for port in [*healthy_ports, unused_port()]:
+                manager.add_proxy("127.0.0.1", port)
+            assert manager.get_active_proxies() == []
+
+            checker = HealthChecker(check_url=CHECK_URL, timeout=2, concurrency=2)
+            result = await checker.check_batch_parallel(
+                manager.get_all_proxies(), workers=2
+            )
+            await checker.aclose()
+
+        assert result.total == 4
+        assert result.healthy == 3
+        assert result.unhealthy == 1
+        assert result.avg_latency_ms > 0
+
+        for proxy in manager.get_all_proxies():
+            if proxy.port in healthy_ports:
+                assert proxy.status is ProxyStatus.ACTIVE
+                assert proxy.success_rate == 100.0
+            else:
+                assert proxy.status is not ProxyStatus.ACTIVE
+                assert proxy.success_rate == 0.0
+                assert proxy.failure_count == 1
+
+        active_ports = sorted(p.port for p in manager.get_active_proxies())
+        assert active_ports == sorted(healthy_ports)
+        manager.close()
+
+    @pytest.mark.asyncio
+    async def test_cancel_check_batch_parallel_does_not_block_loop(self):
+        """Test that cancelling a sharded check returns without waiting for workers."""
+        async with stub_proxy(delay=2) as port:
+            checker = HealthChecker(check_url=CHECK_URL, timeout=3, concurrency=2)
+            proxies = make_proxies(port, 4)
+            batch = asyncio.create_task(
+                checker.check_batch_parallel(proxies, workers=2)
+            )
+            await asyncio.sleep(0.5)
+            batch.cancel()
+            start = time.monotonic()
+            with pytest.raises(asyncio.CancelledError):
+                await batch
+            elapsed = time.monotonic() - start
+            await checker.aclose()
+
+        assert elapsed < 1
@@ -4,16 +4,26 @@ import pytest
 import asyncio
 from scheduler import ProxyScheduler, SchedulerConfig, RotationStrategy
 
+PROXY_URLS = ["http://proxy1:8080", "http://proxy2:8080", "http://proxy3:8080"]
+
+
+@pytest.fixture(scope="session")
+def _base_scheduler():
+    config = SchedulerConfig(strategy=RotationStrategy.ROUND_ROBIN)
+    s = ProxyScheduler(config)
+    for url in PROXY_URLS:
+        s.add_proxy(url)
+    return s
+
 
 class TestProxyScheduler:
     @pytest.fixture
-    def scheduler(self):
-        config = SchedulerConfig(strategy=RotationStrategy.ROUND_ROBIN)
-        s = ProxyScheduler(config)
-        s.add_proxy("http://proxy1:8080")
-        s.add_proxy("http://proxy2:8080")
-        s.add_proxy("http://proxy3:8080")
-        return s
+    def scheduler(self, _base_scheduler):
+        # Reuse one scheduler across tests; restore any removed proxies
+        _base_scheduler.reset()
+        for url in PROXY_URLS:
+            _base_scheduler.add_proxy(url)
+        return _base_scheduler
 
     def test_add_proxy(self, scheduler):
         assert scheduler.proxy_count == 3
@@ -31,6 +41,19 @@ class TestProxyScheduler:
         assert p1 != p2
         assert p1 == p4  # wraps around
 
+    @pytest.mark.asyncio
+    async def test_get_next_batch(self, scheduler):
+        ps = await scheduler.get_next_batch(4)
+        assert len(ps) == 4
+        assert len(set(ps[:3])) == 3
+        assert ps[0] == ps[3]  # wraps around
+        assert sum(s["total"] for s in scheduler.get_stats()) == 4
+
+    @pytest.mark.asyncio
+    async def test_get_next_batch_no_proxies(self):
+        s = ProxyScheduler()
+        assert await s.get_next_batch(3) == []
+
     def test_report_success(self, scheduler):
         scheduler.report_success("http://proxy1:8080", response_time=0.5)
         stats = scheduler.get_stats()
@@ -52,6 +75,18 @@ class TestProxyScheduler:
         result = await s.get_next()
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_reset_clears_counters(self, scheduler):
+        await scheduler.get_next()
+        scheduler.report_failure("http://proxy1:8080")
+        scheduler.report_success("http://proxy2:8080", response_time=0.2)
+        scheduler.reset()
+        assert scheduler.proxy_count == 3
+        assert all(
+            s["total"] == 0 and s["success"] == 0 and s["failed"] == 0
+            for s in scheduler.get_stats()
+        )
+
     def test_get_stats(self, scheduler):
         stats = scheduler.get_stats()
         assert len(stats) == 3